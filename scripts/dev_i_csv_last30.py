@@ -5,6 +5,9 @@
 Development.i — CSV downloader via real browser (Playwright)
 Runs on GitHub Actions (headless Chromium, no sandbox) and downloads the CSV.
 
+With ``--direct-http`` the CSV is first requested straight from the export
+endpoint, falling back to the browser flow when that does not yield a CSV.
+
 Usage (locally):
     python scripts/dev_i_csv_last30.py --days 30 --out output/dev_i_last30.csv --headless
 """
@@ -12,16 +15,42 @@ Usage (locally):
 from __future__ import annotations
 
 import argparse
+import csv
 import datetime as dt
+import http.client
+import json
+import os
 import re
+import shutil
 import sys
+import urllib.error
+import urllib.parse
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.cookiejar import CookieJar
 from pathlib import Path
-from typing import Callable, Iterable, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Pattern, Sequence, Tuple, Union
 
-from playwright.sync_api import Locator, TimeoutError as PWTimeout, sync_playwright
+if TYPE_CHECKING:
+    from playwright.sync_api import Locator, Page
 
 # The page with the search + results; you used this already:
 BASE_URL = "https://developmenti.brisbane.qld.gov.au/Home/ApplicationSearch"
+# Presumed export endpoint behind the "Download CSV" button, inferred from the
+# search URL rather than captured from a real request, so the direct path is
+# opt-in (--direct-http) until it has been verified. The search page hands out
+# the antiforgery cookies it would expect.
+CSV_EXPORT_URL = "https://developmenti.brisbane.qld.gov.au/Home/ApplicationSearchResults"
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/csv,application/octet-stream;q=0.9,*/*;q=0.5",
+    "Referer": BASE_URL,
+    "X-Requested-With": "XMLHttpRequest",
+}
 
 # folders we’ll actually have in GitHub
 OUT_DIR = Path("output")
@@ -30,181 +59,434 @@ DBG_DIR = Path("logs/debug")
 for d in (OUT_DIR, SS_DIR, DBG_DIR):
     d.mkdir(parents=True, exist_ok=True)
 
+# Step screenshots are expensive full-page rasterisations; only take them when debugging.
+DEBUG = os.environ.get("DEV_I_DEBUG") == "1"
+# Fall back to the old Python-side locator chain when the in-page resolver misses.
+LEGACY_RESOLVERS = os.environ.get("DEV_I_LEGACY_RESOLVERS") == "1"
+
+# Launch flags tuned for a single-page automation on CI runners: no zygote,
+# no /dev/shm (tiny on containers), and none of Chrome's background services.
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--no-zygote",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-translate",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees",
+]
+
+# Fail a missing control in 10 s rather than Playwright's 30 s default; the
+# only long waits left are explicit (search page load, CSV download).
+DEFAULT_TIMEOUT_MS = 10000
+NAVIGATION_TIMEOUT_MS = 30000
+
+# Chromium profile reused across runs.
+_PERSISTENT_DIR = Path(".pw-profile")
+
+# Control labels, compiled once rather than on every selector attempt.
+_DATE_RANGE_RE = re.compile(r"Date Range", re.I)
+_SHOW_RESULTS_RE = re.compile(r"Show Results", re.I)
+_LIST_RE = re.compile(r"List", re.I)
+_CSV_RE = re.compile(r"CSV", re.I)
+_DOWNLOAD_CSV_RE = re.compile(r"Download CSV", re.I)
+_FROM_RE = re.compile(r"from|start", re.I)
+_TO_RE = re.compile(r"to|end", re.I)
+# Anchored so it cannot hit a datepicker or filter-chip "Clear" button.
+_RESET_RE = re.compile(r"^(Reset|Reset search|Clear all)$", re.I)
+# A header cell of the real export; anything without one is an error page or JSON.
+_EXPORT_HEADER_RE = re.compile(r"application", re.I)
+
+# Requests the automation never needs; documents, scripts, CSS and XHR still load.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+# Third-party beacons get an instant empty 204 instead of an abort, so the app
+# does not retry them and they never hold the network open.
+_STUBBED_HOSTS_RE = re.compile(
+    r"google-analytics|googletagmanager|gtag/js|doubleclick|hotjar|segment\.(?:io|com)"
+    r"|newrelic|nr-data\.net|fonts\.googleapis"
+)
+
+# First control the flow interacts with; its presence means the SPA has rendered.
+_DATE_RANGE_CONTROL = "button:has-text('Date Range'), [aria-label*='Date Range']"
+_CSV_CONTROL = "button:has-text('CSV'), a:has-text('CSV'), [role=button][aria-label*=CSV i]"
+
 
 def date_range_ddmmyyyy(days: int) -> tuple[str, str]:
     end = dt.date.today()
     start = end - dt.timedelta(days=days)
-    return start.strftime("%d/%m/%Y"), end.strftime("%d/%m/%Y")
+    # Formatted by hand so the browser/process locale can never change the layout.
+    return (
+        f"{start.day:02d}/{start.month:02d}/{start.year:04d}",
+        f"{end.day:02d}/{end.month:02d}/{end.year:04d}",
+    )
+
 
+def set_debug(enabled: bool) -> None:
+    """Turn step screenshots on or off for this process (``--debug-screenshots``)."""
 
-def ss(page, name: str) -> None:
+    global DEBUG
+    DEBUG = enabled
+
+
+def ss(page, name: str, force: bool = False) -> None:
+    """Full-page screenshot; step captures only happen with DEV_I_DEBUG=1 unless forced."""
+
+    if not (DEBUG or force):
+        return
     try:
         page.screenshot(path=str(SS_DIR / f"{name}.png"), full_page=True)
     except Exception:
         pass
 
 
-def try_click_many(page, candidates: Iterable[Tuple[str, str]], timeout: int = 4000) -> bool:
-    for kind, label in candidates:
+def dump_dom(page, name: str) -> None:
+    try:
+        (DBG_DIR / f"{name}.html").write_text(page.content(), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def capture_failure(page, name: str) -> None:
+    """Write the DOM dump and a forced screenshot for a failed step."""
+
+    # DOM first: it is cheap and stays useful if the screenshot times out.
+    dump_dom(page, name)
+    ss(page, name, force=True)
+
+
+def block_heavy_resources(ctx) -> None:
+    """Stub analytics and abort images, fonts and media for every page in ``ctx``."""
+
+    def _handle(route) -> None:
+        request = route.request
+        if _STUBBED_HOSTS_RE.search(request.url):
+            route.fulfill(status=204, body="")
+        elif request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    ctx.route("**/*", _handle)
+
+
+def _candidate_locator(page, kind: str, label: Union[str, Pattern[str]]) -> Optional["Locator"]:
+    if kind == "role_button":
+        return page.get_by_role("button", name=label)
+    if kind == "role_link":
+        return page.get_by_role("link", name=label)
+    if kind == "text":
+        return page.get_by_text(label)
+    if kind == "css":
+        return page.locator(label)
+    return None
+
+
+def try_click_many(
+    page,
+    candidates: Iterable[Tuple[str, Union[str, Pattern[str]]]],
+    timeout: int = 4000,
+    required: bool = False,
+) -> bool:
+    """Click the first candidate present on the page; ``css`` takes a selector, the rest a pattern.
+
+    Candidates that match nothing are skipped without waiting, so optional
+    probes cost nothing when the control is absent. With ``required`` the
+    union of all candidates is first given ``timeout`` to attach, for controls
+    that are expected but may not have rendered yet.
+    """
+    resolved = (_candidate_locator(page, kind, label) for kind, label in candidates)
+    locators = [loc for loc in resolved if loc is not None]
+    if required and locators:
+        union = locators[0]
+        for loc in locators[1:]:
+            union = union.or_(loc)
         try:
-            if kind == "role_button":
-                page.get_by_role("button", name=re.compile(label, re.I)).first.click(timeout=timeout)
-                return True
-            if kind == "role_link":
-                page.get_by_role("link", name=re.compile(label, re.I)).first.click(timeout=timeout)
-                return True
-            if kind == "text":
-                page.get_by_text(re.compile(label, re.I)).first.click(timeout=timeout)
-                return True
-            if kind == "css":
-                page.locator(label).first.click(timeout=timeout)
-                return True
+            union.first.wait_for(state="attached", timeout=timeout)
+        except Exception:
+            pass
+    for loc in locators:
+        try:
+            if loc.count() == 0:
+                continue
+            loc.first.click(timeout=timeout)
+            return True
         except Exception:
             continue
     return False
 
 
-def maybe_dismiss_banners(page) -> None:
-    try_click_many(
-        page,
-        [
-            ("role_button", r"Accept|I Agree|Got it|Close|Dismiss"),
-            ("text", r"Accept|I Agree|Got it|Close|Dismiss"),
-        ],
-        timeout=2000,
-    )
+def open_search_page(page) -> None:
+    """Navigate to the search page and return as soon as the date range control exists."""
+
+    page.goto(BASE_URL, wait_until="commit", timeout=60000)
+    try:
+        page.wait_for_selector(_DATE_RANGE_CONTROL, timeout=30000)
+    except Exception:
+        pass
+    ss(page, "01_loaded")
+
+
+# Clicks the first cookie/consent banner button, whether already present or
+# inserted later, then stops observing; it also gives up a few seconds after
+# load so pages without a banner don't pay for it. Scoped to banner-like
+# containers with anchored labels so it can never hit the date picker's own
+# "Close" button.
+_BANNER_AUTOCLICK_JS = """
+(() => {
+    const BANNER_WATCH_MS = 5000;
+    const label = /^(Accept( all)?( cookies)?|I Agree|Got it|Close|Dismiss)$/i;
+    const scope = "[class*='cookie' i], [id*='cookie' i], [class*='consent' i], [id*='consent' i], "
+        + "[class*='banner' i], [id*='banner' i]";
+    const dismiss = () => {
+        for (const el of document.querySelectorAll(`:is(${scope}) :is(button, a)`)) {
+            if (label.test((el.textContent || "").trim())) {
+                el.click();
+                return true;
+            }
+        }
+        return false;
+    };
+    const observer = new MutationObserver(() => {
+        if (dismiss()) observer.disconnect();
+    });
+    const start = () => {
+        if (dismiss()) return;
+        observer.observe(document.documentElement, { childList: true, subtree: true });
+    };
+    if (document.documentElement) start();
+    else document.addEventListener("DOMContentLoaded", start);
+    // Banners show up during page load; stop scanning mutations a few seconds after it.
+    const stop = () => setTimeout(() => observer.disconnect(), BANNER_WATCH_MS);
+    if (document.readyState === "complete") stop();
+    else window.addEventListener("load", stop, { once: true });
+})();
+"""
+
+
+def install_banner_autoclick(ctx) -> None:
+    """Dismiss cookie banners in-page so the main flow never waits on them."""
+
+    ctx.add_init_script(_BANNER_AUTOCLICK_JS)
 
 
 def open_date_range(page) -> None:
     try_click_many(
         page,
         [
-            ("role_button", r"Date Range"),
-            ("text", r"Date Range"),
+            ("role_button", _DATE_RANGE_RE),
+            ("text", _DATE_RANGE_RE),
         ],
-        timeout=8000,
+        timeout=6000,
+        required=True,
     )
-    page.wait_for_timeout(300)
+    try:
+        page.locator(".mat-datepicker-content, .date-range-panel").first.wait_for(state="visible", timeout=2000)
+    except Exception:
+        pass
     ss(page, "02_date_range_open")
 
 
-def set_date_range(page, start: str, end: str) -> bool:
-    """Attempt to populate the date range inputs with multiple selector strategies."""
-
-    LocatorResolver = Callable[[], tuple[Locator, Locator]]
-
-    def _by_css(start_sel: str, end_sel: str) -> LocatorResolver:
-        return lambda: (
-            page.locator(start_sel).first,
-            page.locator(end_sel).first,
-        )
-
-    def _by_css_indices(selector: str, start_idx: int, end_idx: int) -> LocatorResolver:
-        return lambda: (
-            page.locator(selector).nth(start_idx),
-            page.locator(selector).nth(end_idx),
-        )
-
-    def _by_label(start_label: str, end_label: str) -> LocatorResolver:
-        return lambda: (
-            page.get_by_label(re.compile(start_label, re.I)).first,
-            page.get_by_label(re.compile(end_label, re.I)).first,
-        )
-
-    def _by_placeholder(start_placeholder: str, end_placeholder: str) -> LocatorResolver:
-        return lambda: (
-            page.get_by_placeholder(re.compile(start_placeholder, re.I)).first,
-            page.get_by_placeholder(re.compile(end_placeholder, re.I)).first,
-        )
-
-    def _by_within(container_selector: str, child_selector: str = "input") -> LocatorResolver:
-        container = page.locator(container_selector).first
-        return lambda: (
-            container.locator(child_selector).nth(0),
-            container.locator(child_selector).nth(1),
-        )
-
-    candidate_locators: Sequence[LocatorResolver] = (
-        _by_label(r"from|start", r"to|end"),
-        _by_placeholder(r"from|start", r"to|end"),
-        _by_css("input[placeholder*='Start']", "input[placeholder*='End']"),
-        _by_css("input[placeholder*='From']", "input[placeholder*='To']"),
-        _by_css("input[data-placeholder*='From']", "input[data-placeholder*='To']"),
-        _by_css("input[aria-label*='from']", "input[aria-label*='to']"),
-        _by_within("app-date-range"),
-        _by_within("[data-testid='date-range']"),
-        _by_within(".date-range, .mat-date-range-input-container"),
-        _by_css_indices("input[type='text']", 0, 1),
-        _by_css_indices("input.mat-input-element", 0, 1),
-    )
+_FILL_INPUTS_JS = """
+([startEl, endEl, startVal, endVal]) => {
+    for (const [el, value] of [[startEl, startVal], [endEl, endVal]]) {
+        el.scrollIntoView({ block: "center" });
+        el.focus();
+        el.value = "";
+        el.value = value;
+        el.dispatchEvent(new Event("input", { bubbles: true }));
+        el.dispatchEvent(new Event("change", { bubbles: true }));
+        el.blur();
+    }
+    endEl.focus();
+}
+"""
 
-    def _fill_inputs(start_inp: Locator, end_inp: Locator) -> bool:
+# Date range input strategies as (kind, start, end) descriptors, in priority order.
+# "label"/"placeholder" take patterns, "css" a selector per input, and "within"
+# a container plus the child selector whose first two matches are the inputs.
+_STRATEGIES: Tuple[Tuple[str, Union[str, Pattern[str]], Union[str, Pattern[str]]], ...] = (
+    ("label", _FROM_RE, _TO_RE),
+    ("placeholder", _FROM_RE, _TO_RE),
+    ("css", "input[formcontrolname='fromDate']", "input[formcontrolname='toDate']"),
+    ("css", "input[formcontrolname='fromDateInput']", "input[formcontrolname='toDateInput']"),
+    ("css", "input[placeholder*='Start']", "input[placeholder*='End']"),
+    ("css", "input[placeholder*='From']", "input[placeholder*='To']"),
+    ("css", "input[data-placeholder*='From']", "input[data-placeholder*='To']"),
+    ("css", "input[aria-label*='from']", "input[aria-label*='to']"),
+    ("within", "app-date-range", "input"),
+    ("within", "[data-testid='date-range']", "input"),
+    ("within", ".date-range, .mat-date-range-input-container", "input"),
+    ("within", "body", "input[type='text']"),
+    ("within", "body", "input.mat-input-element"),
+)
+# The same descriptors in JSON-friendly form for the in-page resolver.
+_JS_STRATEGIES = [
+    [kind, getattr(a, "pattern", a), getattr(b, "pattern", b)] for kind, a, b in _STRATEGIES
+]
+
+
+def _resolve(page, kind: str, a, b) -> "tuple[Locator, Locator]":
+    if kind == "label":
+        return page.get_by_label(a).first, page.get_by_label(b).first
+    if kind == "placeholder":
+        return page.get_by_placeholder(a).first, page.get_by_placeholder(b).first
+    if kind == "css":
+        return page.locator(a).first, page.locator(b).first
+    container = page.locator(a).first
+    return container.locator(b).nth(0), container.locator(b).nth(1)
+
+
+def _set_date_range_locators(page, start: str, end: str) -> bool:
+    """Python-side resolver chain, kept behind DEV_I_LEGACY_RESOLVERS=1."""
+
+    def _type_inputs(start_inp: Locator, end_inp: Locator) -> None:
         for inp, value in ((start_inp, start), (end_inp, end)):
-            inp.scroll_into_view_if_needed(timeout=2000)
-            inp.wait_for(state="visible", timeout=5000)
+            inp.scroll_into_view_if_needed(timeout=1500)
+            inp.wait_for(state="visible", timeout=1500)
             inp.click()
             try:
                 inp.press("Control+A")
             except Exception:
                 pass
-            inp.fill(value, timeout=5000)
+            inp.fill(value, timeout=1500)
 
+    def _fill_inputs(start_inp: Locator, end_inp: Locator) -> bool:
+        # One evaluate does the whole scroll/focus/set/dispatch sequence for both inputs.
+        page.evaluate(
+            _FILL_INPUTS_JS,
+            [start_inp.element_handle(timeout=1500), end_inp.element_handle(timeout=1500), start, end],
+        )
         page.keyboard.press("Enter")
-        page.wait_for_timeout(1000)
 
-        start_val = start_inp.input_value().strip()
-        end_val = end_inp.input_value().strip()
-        return start_val == start and end_val == end
+        if start_inp.input_value().strip() == start and end_inp.input_value().strip() == end:
+            return True
 
-    for resolver in candidate_locators:
+        # Some datepickers ignore programmatic values; fall back to typing them.
+        _type_inputs(start_inp, end_inp)
+        page.keyboard.press("Enter")
+        return start_inp.input_value().strip() == start and end_inp.input_value().strip() == end
+
+    # Race every strategy with a single wait so misses cost one timeout, not one each.
+    resolved = [_resolve(page, kind, a, b) for kind, a, b in _STRATEGIES]
+    any_start = resolved[0][0]
+    for start_inp, _ in resolved[1:]:
+        any_start = any_start.or_(start_inp)
+    try:
+        any_start.first.wait_for(state="visible", timeout=5000)
+    except Exception:
+        pass
+
+    for start_inp, end_inp in resolved:
         try:
-            start_inp, end_inp = resolver()
+            if start_inp.count() == 0 or end_inp.count() == 0:
+                continue
             if _fill_inputs(start_inp, end_inp):
                 ss(page, "03_dates_set")
                 return True
         except Exception:
             continue
 
-    # As a last resort, try to set the values via JavaScript where the input elements expose "value".
+    return False
+
+
+# Resolves and fills both date inputs inside the page in one call, walking
+# _STRATEGIES in order; the first visible, distinct pair wins. The inputs are
+# tagged so the values can be read back after Enter without another lookup.
+_DATE_RANGE_JS = """
+({ strategies, start, end }) => {
+    const visible = (el) => !!el && !el.disabled && el.getClientRects().length > 0;
+    const byLabel = (re) => {
+        for (const lbl of document.querySelectorAll("label")) {
+            if (!re.test(lbl.textContent || "")) continue;
+            const el = lbl.control || lbl.querySelector("input");
+            if (visible(el)) return el;
+        }
+        return null;
+    };
+    const byPlaceholder = (re) =>
+        Array.from(document.querySelectorAll("input[placeholder]")).find(
+            (el) => re.test(el.placeholder) && visible(el)
+        ) || null;
+    const pick = (kind, a, b) => {
+        if (kind === "label") return [byLabel(new RegExp(a, "i")), byLabel(new RegExp(b, "i"))];
+        if (kind === "placeholder") return [byPlaceholder(new RegExp(a, "i")), byPlaceholder(new RegExp(b, "i"))];
+        if (kind === "css") return [document.querySelector(a), document.querySelector(b)];
+        const root = document.querySelector(a);
+        const inputs = root ? root.querySelectorAll(b) : [];
+        return [inputs[0], inputs[1]];
+    };
+    for (const [kind, a, b] of strategies) {
+        const [startEl, endEl] = pick(kind, a, b);
+        if (!visible(startEl) || !visible(endEl) || startEl === endEl) continue;
+        document.querySelectorAll("[data-devi-range]").forEach((el) => el.removeAttribute("data-devi-range"));
+        for (const [el, value, key] of [[startEl, start, "start"], [endEl, end, "end"]]) {
+            el.scrollIntoView({ block: "center" });
+            el.focus();
+            el.value = "";
+            el.value = value;
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+            el.blur();
+            el.setAttribute("data-devi-range", key);
+        }
+        endEl.focus();
+        return true;
+    }
+    return false;
+}
+"""
+
+_READ_DATE_RANGE_JS = """
+() => ["start", "end"].map((key) => {
+    const el = document.querySelector(`[data-devi-range="${key}"]`);
+    return el ? el.value.trim() : "";
+})
+"""
+
+
+def set_date_range(page, start: str, end: str) -> bool:
+    """Populate the date range inputs using an in-page resolver, polling until they render."""
+
+    config = {"strategies": _JS_STRATEGIES, "start": start, "end": end}
     try:
-        js_start_selectors = (
-            "input[formcontrolname='fromDate']",
-            "input[formcontrolname='fromDateInput']",
-            "input[aria-label*='from']",
-        )
-        js_end_selectors = (
-            "input[formcontrolname='toDate']",
-            "input[formcontrolname='toDateInput']",
-            "input[aria-label*='to']",
-        )
-        for start_sel in js_start_selectors:
-            for end_sel in js_end_selectors:
-                start_ok = page.evaluate(
-                    "(sel, value) => { const el = document.querySelector(sel); if (!el) return false; el.value = value; el.dispatchEvent(new Event('input', { bubbles: true })); return true; }",
-                    start_sel,
-                    start,
-                )
-                end_ok = page.evaluate(
-                    "(sel, value) => { const el = document.querySelector(sel); if (!el) return false; el.value = value; el.dispatchEvent(new Event('input', { bubbles: true })); return true; }",
-                    end_sel,
-                    end,
-                )
-                if start_ok and end_ok:
-                    page.keyboard.press("Enter")
-                    page.wait_for_timeout(1000)
-                    ss(page, "03_dates_set")
-                    return True
+        page.wait_for_function(_DATE_RANGE_JS, arg=config, timeout=5000)
+        page.keyboard.press("Enter")
+        if page.evaluate(_READ_DATE_RANGE_JS) == [start, end]:
+            ss(page, "03_dates_set")
+            return True
     except Exception:
         pass
 
+    if LEGACY_RESOLVERS:
+        return _set_date_range_locators(page, start, end)
     return False
 
 
+def _is_search_response(response) -> bool:
+    return response.request.resource_type in ("xhr", "fetch") and "Search" in response.url
+
+
 def show_results(page) -> None:
-    try_click_many(page, [("text", r"Show Results"), ("role_button", r"Show Results")], timeout=10000)
-    page.wait_for_timeout(1200)
-    try_click_many(page, [("text", r"List"), ("role_button", r"List")], timeout=6000)
-    page.wait_for_timeout(1200)
+    # Wait for the search XHR itself rather than a fixed pause after the click.
+    try:
+        with page.expect_response(_is_search_response, timeout=10000):
+            try_click_many(
+                page,
+                [("text", _SHOW_RESULTS_RE), ("role_button", _SHOW_RESULTS_RE)],
+                timeout=6000,
+                required=True,
+            )
+    except Exception:
+        pass
+    # The List toggle is optional; the results may already be in list view.
+    # try_click_many skips absent controls at once, so let the toolbar render first.
+    wait_for_results(page)
+    try_click_many(page, [("text", _LIST_RE), ("role_button", _LIST_RE)], timeout=2000)
     ss(page, "04_results_view")
 
 
@@ -213,85 +495,252 @@ def wait_for_results(page, timeout_ms: int = 20000) -> bool:
         page.wait_for_selector("table, .mat-table, .results, .list", timeout=timeout_ms, state="visible")
         try:
             page.wait_for_selector(".mat-progress-bar, .loading, .spinner", state="hidden", timeout=5000)
-        except PWTimeout:
+        except Exception:
             pass
         return True
-    except PWTimeout:
+    except Exception:
         return False
 
 
+def save_download(download, dest: Path) -> None:
+    """Move a finished download into place; a rename on the same filesystem, not a copy."""
+
+    tmp = download.path()
+    if tmp:
+        # save_as creates missing parent folders; shutil.move does not.
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(tmp), str(dest))
+    else:
+        download.save_as(str(dest))
+
+
+def _download_from(page, loc: "Locator", save_path: Path) -> bool:
+    with page.expect_download(timeout=15000) as dl_wait:
+        loc.click(timeout=6000)
+    save_download(dl_wait.value, save_path)
+    return save_path.exists() and save_path.stat().st_size > 0
+
+
 def click_download_csv(page, save_path: Path) -> bool:
+    # Find the control before opening a download expectation, so a missing
+    # button costs one visibility wait instead of a download timeout per pattern.
+    try:
+        loc = page.locator(_CSV_CONTROL).first
+        loc.wait_for(state="visible", timeout=8000)
+        if _download_from(page, loc, save_path):
+            return True
+    except Exception:
+        pass
+
     patterns = [
-        ("role_button", r"CSV"),
-        ("role_button", r"Download CSV"),
-        ("text", r"CSV"),
-        ("text", r"Download CSV"),
-        ("css", "button:has-text('CSV'), a:has-text('CSV')"),
+        ("role_button", _CSV_RE),
+        ("role_button", _DOWNLOAD_CSV_RE),
+        ("text", _CSV_RE),
+        ("text", _DOWNLOAD_CSV_RE),
     ]
     for kind, label in patterns:
         try:
-            page.wait_for_timeout(800)
-            with page.expect_download(timeout=20000) as dl_wait:
-                if kind == "role_button":
-                    btn = page.get_by_role("button", name=re.compile(label, re.I)).first
-                    btn.wait_for(state="visible", timeout=8000)
-                    btn.click(timeout=6000)
-                elif kind == "text":
-                    link = page.get_by_text(re.compile(label, re.I)).first
-                    link.wait_for(state="visible", timeout=8000)
-                    link.click(timeout=6000)
-                else:
-                    loc = page.locator(label).first
-                    loc.wait_for(state="visible", timeout=8000)
-                    loc.click(timeout=6000)
-            dl = dl_wait.value
-            dl.save_as(str(save_path))
-            return save_path.exists() and save_path.stat().st_size > 0
+            if kind == "role_button":
+                loc = page.get_by_role("button", name=label).first
+            else:
+                loc = page.get_by_text(label).first
+            if loc.count() == 0:
+                continue
+            loc.wait_for(state="visible", timeout=8000)
+            if _download_from(page, loc, save_path):
+                return True
         except Exception:
             continue
     return False
 
 
-def run(days: int, status: Optional[str], out_csv: Path, headless: bool) -> int:
-    dates_set = False
+def _is_export_header(line: bytes) -> bool:
+    try:
+        fields = next(csv.reader([line.decode("utf-8-sig")]))
+    except (UnicodeDecodeError, csv.Error, StopIteration):
+        return False
+    return len(fields) > 1 and any(_EXPORT_HEADER_RE.search(f) for f in fields)
+
+
+def download_csv_direct(start: str, end: str, save_path: Path, timeout: float = 15.0) -> bool:
+    """Fetch the CSV export over plain HTTP, skipping the browser entirely.
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless, args=["--no-sandbox", "--disable-gpu"])
-        ctx = browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1440, "height": 900},
-            timezone_id="Australia/Brisbane",
-            locale="en-AU",
-        )
-        page = ctx.new_page()
+    Returns ``False`` (leaving no file behind) unless the endpoint answers with
+    a CSV content type and the export's header row; callers then fall back to
+    the browser.
+    """
 
-        page.goto(BASE_URL, wait_until="domcontentloaded", timeout=60000)
-        ss(page, "01_loaded")
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+    query = urllib.parse.urlencode({"format": "csv", "fromDate": start, "toDate": end})
+    tmp_path = save_path.with_suffix(".partial")
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Bootstrap the session so the export request carries antiforgery cookies.
+        with opener.open(urllib.request.Request(BASE_URL, headers=HTTP_HEADERS), timeout=timeout) as resp:
+            resp.read()
+        req = urllib.request.Request(f"{CSV_EXPORT_URL}?{query}", headers=HTTP_HEADERS)
+        with opener.open(req, timeout=timeout) as resp:
+            content_type = resp.headers.get("Content-Type", "").lower()
+            if resp.status != 200 or not ("csv" in content_type or "octet-stream" in content_type):
+                return False
+            header = resp.readline()
+            if not _is_export_header(header):
+                return False
+            # A single read() raises IncompleteRead on a truncated body, where
+            # chunked reads would silently stop short.
+            body = resp.read()
+            with tmp_path.open("wb") as fh:
+                fh.write(header)
+                fh.write(body)
+        tmp_path.replace(save_path)
+    except (urllib.error.URLError, http.client.HTTPException, OSError):
+        return False
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return save_path.stat().st_size > 0
 
-        maybe_dismiss_banners(page)
-        open_date_range(page)
-        start, end = date_range_ddmmyyyy(days)
-        dates_set = set_date_range(page, start, end)
-        show_results(page)
-        ok_results = wait_for_results(page)
 
-        ok_csv = click_download_csv(page, out_csv)
-        ss(page, "05_after_download")
+@dataclass
+class RunJob:
+    days: int
+    out: Path
+    status: Optional[str] = None
 
-        browser.close()
 
-    if ok_csv:
-        print(f"[OK] CSV saved -> {out_csv} ({out_csv.stat().st_size} bytes)")
-        return 0
+def load_jobs(path: Path) -> list[RunJob]:
+    """Read ``[{"days": 30, "out": "output/x.csv", "status": null}, ...]`` from JSON."""
+
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return [RunJob(days=int(e["days"]), out=Path(e["out"]), status=e.get("status")) for e in entries]
+
+
+def reset_search(page) -> None:
+    """Return the page to a fresh search form, re-navigating if there is no Reset button."""
+
+    reset = page.get_by_role("button", name=_RESET_RE)
+    if reset.count() > 0:
+        try:
+            reset.first.click(timeout=4000)
+            # The form re-renders after a reset; wait for it as open_search_page does.
+            page.wait_for_selector(_DATE_RANGE_CONTROL, timeout=10000)
+            return
+        except Exception:
+            pass
+    open_search_page(page)
+
+
+def _download_once(page, days: int, status: Optional[str], out: Path) -> bool:
+    """Run one search + CSV download on an already open search page.
 
+    ``status`` is carried through for parity with the CLI; the search form is
+    not filtered by it yet.
+    """
+
+    open_date_range(page)
+    start, end = date_range_ddmmyyyy(days)
+    dates_set = set_date_range(page, start, end)
+    show_results(page)
+    ok_results = wait_for_results(page)
+
+    if click_download_csv(page, out):
+        print(f"[OK] CSV saved -> {out} ({out.stat().st_size} bytes)")
+        return True
+
+    # One artifact set per job so later failures in a batch don't overwrite it.
+    artifact = f"error_state_{out.stem}"
+    capture_failure(page, artifact)
     print(
-        "[ERROR] CSV not downloaded or empty.\n"
+        f"[ERROR] CSV not downloaded or empty ({out}).\n"
         f"  - Date range applied: {dates_set}\n"
         f"  - Results visible: {ok_results}\n"
-        f"See {SS_DIR} for screenshots.",
+        f"See {artifact} in {SS_DIR} and {DBG_DIR} for the page state.",
         file=sys.stderr,
     )
-    return 2
+    return False
+
+
+def run(
+    days: int,
+    status: Optional[str],
+    out_csv: Path,
+    headless: bool,
+    direct_http: bool = False,
+) -> int:
+    return run_batch([RunJob(days=days, out=out_csv, status=status)], headless, direct_http)
+
+
+@contextmanager
+def browser_session(
+    headless: bool,
+    persistent: bool = False,
+    viewport: Optional[dict[str, int]] = None,
+) -> Iterator["Page"]:
+    """Launch Chromium with every speed-up applied and yield a ready page.
+
+    Launch flags, default timeouts, resource blocking and the banner
+    auto-clicker are configured here once for the CSV script and the pipeline.
+    ``persistent`` reuses the on-disk profile so cookies and caches survive
+    between runs; only one process may hold it at a time. Playwright disables
+    the HTTP cache while any route is installed, so persistent sessions skip
+    resource blocking and rely on the warm cache instead.
+    """
+
+    # Imported lazily: --help and the direct HTTP path never need Playwright.
+    from playwright.sync_api import sync_playwright
+
+    options = {
+        "accept_downloads": True,
+        "viewport": viewport or {"width": 1440, "height": 900},
+        "timezone_id": "Australia/Brisbane",
+        "locale": "en-AU",
+    }
+    with sync_playwright() as p:
+        browser = None
+        if persistent:
+            ctx = p.chromium.launch_persistent_context(
+                str(_PERSISTENT_DIR), headless=headless, args=CHROMIUM_ARGS, **options
+            )
+        else:
+            browser = p.chromium.launch(headless=headless, args=CHROMIUM_ARGS)
+            ctx = browser.new_context(**options)
+        try:
+            ctx.set_default_timeout(DEFAULT_TIMEOUT_MS)
+            ctx.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+            if not persistent:
+                block_heavy_resources(ctx)
+            install_banner_autoclick(ctx)
+            yield ctx.pages[0] if ctx.pages else ctx.new_page()
+        finally:
+            ctx.close()
+            if browser is not None:
+                browser.close()
+
+
+def run_batch(jobs: Sequence[RunJob], headless: bool, direct_http: bool = False) -> int:
+    """Download every job's CSV, sharing one browser session for those that need it."""
+
+    pending: list[RunJob] = []
+    for job in jobs:
+        if direct_http:
+            start, end = date_range_ddmmyyyy(job.days)
+            if download_csv_direct(start, end, job.out):
+                print(f"[OK] CSV saved -> {job.out} ({job.out.stat().st_size} bytes)")
+                continue
+            print("[WARN] Direct CSV export failed; falling back to the browser flow.", file=sys.stderr)
+        pending.append(job)
+    if not pending:
+        return 0
+
+    failures = 0
+    with browser_session(headless, persistent=True) as page:
+        open_search_page(page)
+        for idx, job in enumerate(pending):
+            if idx:
+                reset_search(page)
+            if not _download_once(page, job.days, job.status, job.out):
+                failures += 1
+
+    return 2 if failures else 0
 
 
 def parse_args() -> argparse.Namespace:
@@ -302,16 +751,37 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--headless", action="store_true", help="Run headless (CI).")
     ap.add_argument("--headed", dest="headless", action="store_false", help="Run with a visible browser.")
     ap.set_defaults(headless=True)
+    ap.add_argument(
+        "--direct-http",
+        action="store_true",
+        help="Try the (unverified) direct HTTP export before driving the site with Playwright.",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=Path,
+        default=None,
+        help="JSON list of {days, out, status} jobs to run in one browser session.",
+    )
+    ap.add_argument(
+        "--debug-screenshots",
+        action="store_true",
+        help="Screenshot every step, not just failures (same as DEV_I_DEBUG=1).",
+    )
     return ap.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    if args.debug_screenshots:
+        set_debug(True)
+    if args.jobs:
+        sys.exit(run_batch(load_jobs(args.jobs), args.headless, args.direct_http))
     code = run(
         days=args.days,
         status=args.status,
         out_csv=args.out,
         headless=args.headless,
+        direct_http=args.direct_http,
     )
     sys.exit(code)
 
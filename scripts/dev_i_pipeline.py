@@ -24,16 +24,23 @@ configuration used in CI.
 from __future__ import annotations
 
 import argparse
+import csv
+import json
 import re
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from queue import Empty, Queue
 from typing import Iterable, Optional
 
 import pandas as pd
-import pdfplumber
-from playwright.sync_api import Page, TimeoutError as PWTimeout, sync_playwright
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from pypdf import PdfReader
+from playwright.sync_api import Page, TimeoutError as PWTimeout
 from tqdm import tqdm
 
 
@@ -43,17 +50,20 @@ from tqdm import tqdm
 
 if __package__:
     from .dev_i_csv_last30 import (  # type: ignore[import-not-found]
-        BASE_URL,
         DBG_DIR,
         OUT_DIR,
         SS_DIR,
+        browser_session,
+        capture_failure,
         click_download_csv,
         date_range_ddmmyyyy,
-        maybe_dismiss_banners,
+        download_csv_direct,
         open_date_range,
+        open_search_page,
+        save_download,
         set_date_range,
+        set_debug,
         show_results,
-        ss,
         wait_for_results,
     )
 else:  # pragma: no cover - support running via ``python scripts/dev_i_pipeline.py``
@@ -61,17 +71,20 @@ else:  # pragma: no cover - support running via ``python scripts/dev_i_pipeline.
     if str(SCRIPT_DIR) not in sys.path:
         sys.path.insert(0, str(SCRIPT_DIR))
     from dev_i_csv_last30 import (  # type: ignore  # noqa: E402
-        BASE_URL,
         DBG_DIR,
         OUT_DIR,
         SS_DIR,
+        browser_session,
+        capture_failure,
         click_download_csv,
         date_range_ddmmyyyy,
-        maybe_dismiss_banners,
+        download_csv_direct,
         open_date_range,
+        open_search_page,
+        save_download,
         set_date_range,
+        set_debug,
         show_results,
-        ss,
         wait_for_results,
     )
 
@@ -85,7 +98,30 @@ DOC_URL_TEMPLATE = (
     "GetAllDocument?applicationId={}"
 )
 
+# Patterns used per CSV row / document row, compiled once.
+APP_RE = re.compile(r"(A00\d{6,})")
+DA_FORM_RE = re.compile(r"\bDA\s*Form\b", re.IGNORECASE)
+ONCLICK_RE = re.compile(r"fileDownload\('([^']+)',\s*'([^']+)',\s*'([^']+)'\)")
+DT_INFO_RE = re.compile(r"(\d+)\s+to\s+(\d+)\s+of\s+(\d+)")
+FS_UNSAFE_CHARS = str.maketrans({c: "_" for c in '\\/*?:"<>|'})
+
+VIEWPORT = {"width": 1600, "height": 1000}
+
 LOG_FILE = OUT_DIR / "download_log.csv"
+LOG_COLUMNS = ["app_no", "file_name", "file_path", "downloaded_at"]
+
+# (app_no, file_name) pairs already in the download log; loaded on first use.
+# Guarded by _LOG_LOCK because DA Form workers log from several threads.
+_LOG_INDEX: Optional[set[tuple[str, str]]] = None
+_LOG_LOCK = threading.Lock()
+
+# Applications whose document library was fully processed, so reruns within
+# SCAN_TTL can skip navigating there: {app_no: {"ts": iso, "count": n}}.
+SCAN_FILE = OUT_DIR / "scanned.json"
+SCAN_TTL_HOURS = 24
+SCAN_TTL = timedelta(hours=SCAN_TTL_HOURS)
+_SCANNED: Optional[dict[str, dict[str, object]]] = None
+_SCAN_LOCK = threading.Lock()
 
 
 def ensure_dir(path: Path) -> None:
@@ -97,50 +133,106 @@ def clean_for_fs(raw: str, max_len: int = 120) -> str:
 
     if not raw:
         return "unnamed"
-    safe = re.sub(r"[\\/*?:\"<>|]", "_", raw.strip())
+    safe = raw.strip().translate(FS_UNSAFE_CHARS)
     return safe[:max_len].strip(" .") or "unnamed"
 
 
 def build_da_folder(app_no: str, address: str) -> Path:
     base = f"{app_no} - {clean_for_fs(address, 90)}" if address else app_no
-    dest = OUT_DIR / base / "DA Form"
-    ensure_dir(dest)
-    return dest
+    return OUT_DIR / base / "DA Form"
 
 
-def load_log() -> pd.DataFrame:
-    if LOG_FILE.exists():
-        try:
-            return pd.read_csv(LOG_FILE, dtype=str)
-        except Exception:
-            pass
-    return pd.DataFrame(columns=["app_no", "file_name", "file_path", "downloaded_at"])
+def _scan_cache() -> dict[str, dict[str, object]]:
+    global _SCANNED
+    with _SCAN_LOCK:
+        if _SCANNED is None:
+            try:
+                _SCANNED = json.loads(SCAN_FILE.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                _SCANNED = {}
+        return _SCANNED
+
+
+def reset_scan_cache() -> None:
+    """Forget earlier scans for this run (``--rescan``); the file is rewritten as apps finish."""
+
+    global _SCANNED
+    with _SCAN_LOCK:
+        _SCANNED = {}
+
+
+def recently_scanned(app_no: str) -> bool:
+    entry = _scan_cache().get(app_no)
+    if not isinstance(entry, dict):
+        return False
+    try:
+        scanned_at = datetime.fromisoformat(str(entry["ts"]))
+    except (KeyError, ValueError):
+        return False
+    return datetime.now() - scanned_at < SCAN_TTL
+
+
+def mark_scanned(app_no: str, count: int) -> None:
+    cache = _scan_cache()
+    with _SCAN_LOCK:
+        cache[app_no] = {"ts": datetime.now().isoformat(timespec="seconds"), "count": count}
+        tmp_path = SCAN_FILE.with_suffix(".partial")
+        tmp_path.write_text(json.dumps(cache, indent=1, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(SCAN_FILE)
+
+
+def _log_index() -> set[tuple[str, str]]:
+    global _LOG_INDEX
+    with _LOG_LOCK:
+        if _LOG_INDEX is not None:
+            return _LOG_INDEX
+        _LOG_INDEX = set()
+        if LOG_FILE.exists():
+            try:
+                with LOG_FILE.open(newline="", encoding="utf-8") as fh:
+                    for row in csv.DictReader(fh):
+                        _LOG_INDEX.add((row.get("app_no") or "", row.get("file_name") or ""))
+            except (OSError, csv.Error):
+                pass
+    return _LOG_INDEX
 
 
 def append_log(app_no: str, file_name: str, file_path: Path) -> None:
-    df = load_log()
-    new = pd.DataFrame(
-        [
-            {
-                "app_no": app_no,
-                "file_name": file_name,
-                "file_path": str(file_path),
-                "downloaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-        ]
-    )
-    df = pd.concat([df, new], ignore_index=True)
-    df.to_csv(LOG_FILE, index=False)
+    """Append one row to the download log, writing the header if the file is new."""
+
+    index = _log_index()
+    with _LOG_LOCK:
+        new_file = not LOG_FILE.exists()
+        with LOG_FILE.open("a", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            if new_file:
+                writer.writerow(LOG_COLUMNS)
+            writer.writerow(
+                [app_no, file_name, str(file_path), datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+            )
+        index.add((app_no, file_name))
 
 
 def in_log(app_no: str, file_name: str) -> bool:
+    return (app_no, file_name) in _log_index()
+
+
+def logged_form_paths(app_nos: set[str]) -> list[Path]:
+    """Return logged DA Form paths for ``app_nos`` that still exist on disk."""
+
+    paths: list[Path] = []
     if not LOG_FILE.exists():
-        return False
+        return paths
     try:
-        df = pd.read_csv(LOG_FILE, dtype=str)
-    except Exception:
-        return False
-    return not df[(df["app_no"] == app_no) & (df["file_name"] == file_name)].empty
+        with LOG_FILE.open(newline="", encoding="utf-8") as fh:
+            for row in csv.DictReader(fh):
+                if row.get("app_no") in app_nos and row.get("file_path"):
+                    path = Path(row["file_path"])
+                    if path.exists():
+                        paths.append(path)
+    except (OSError, csv.Error):
+        pass
+    return paths
 
 
 # ---------------------------------------------------------------------------
@@ -148,28 +240,37 @@ def in_log(app_no: str, file_name: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def download_csv(page: Page, days: int, out_dir: Path) -> Path:
+def download_csv(page: Page, days: int, out_dir: Path, direct_http: bool = False) -> Path:
     """Download the Development.i CSV for the supplied date range."""
 
     ensure_dir(out_dir)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     csv_path = out_dir / f"brisbane_last{days}d_{timestamp}.csv"
 
+    start, end = date_range_ddmmyyyy(days)
+    if direct_http:
+        print(f"[INFO] Requesting CSV export for {start} – {end}…")
+        if download_csv_direct(start, end, csv_path):
+            print(f"[OK] CSV saved -> {csv_path}")
+            return csv_path
+        print("[WARN] Direct CSV export failed; falling back to the browser flow.")
+
     print("[INFO] Opening Application Search…")
-    page.goto(BASE_URL, wait_until="domcontentloaded", timeout=60000)
-    ss(page, "01_loaded")
+    open_search_page(page)
 
-    maybe_dismiss_banners(page)
-    open_date_range(page)
-    start, end = date_range_ddmmyyyy(days)
-    print(f"[INFO] Applying date range {start} – {end}")
-    if not set_date_range(page, start, end):
-        raise RuntimeError("Unable to set the date range inputs.")
-    show_results(page)
-    if not wait_for_results(page):
-        raise RuntimeError("Search results did not render in time.")
-    if not click_download_csv(page, csv_path):
-        raise RuntimeError("CSV download did not succeed.")
+    try:
+        open_date_range(page)
+        print(f"[INFO] Applying date range {start} – {end}")
+        if not set_date_range(page, start, end):
+            raise RuntimeError("Unable to set the date range inputs.")
+        show_results(page)
+        if not wait_for_results(page):
+            raise RuntimeError("Search results did not render in time.")
+        if not click_download_csv(page, csv_path):
+            raise RuntimeError("CSV download did not succeed.")
+    except RuntimeError:
+        capture_failure(page, "error_state")
+        raise
     print(f"[OK] CSV saved -> {csv_path}")
     return csv_path
 
@@ -179,23 +280,32 @@ def download_csv(page: Page, days: int, out_dir: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
+def join_columns(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """Space-join ``columns`` row-wise with vectorised string ops; missing values count as empty."""
+
+    if not columns:
+        return pd.Series("", index=df.index, dtype=object)
+    filled = df[columns].fillna("").astype(str)
+    first, rest = filled.iloc[:, 0], filled.iloc[:, 1:]
+    return first.str.cat(rest, sep=" ") if rest.shape[1] else first
+
+
 def get_applications(csv_path: Path) -> list[dict[str, str]]:
-    """Extract unique application numbers and addresses from the CSV."""
-
-    df = pd.read_csv(csv_path, dtype=str, low_memory=False)
-    records: list[dict[str, str]] = []
-    for _, row in df.iterrows():
-        joined = " ".join(str(value) for value in row.values if pd.notna(value))
-        match = re.search(r"(A00\d{6,})", joined)
-        if not match:
-            continue
-        app_no = match.group(1)
-        addr_columns = [c for c in df.columns if "address" in c.lower()]
-        address = " ".join(str(row.get(col, "")) for col in addr_columns if pd.notna(row.get(col)))
-        records.append({"app_no": app_no, "address": address.strip()})
-    deduped = {rec["app_no"]: rec for rec in records}
-    print(f"[INFO] Found {len(deduped)} unique applications in {csv_path.name}.")
-    return list(deduped.values())
+    """Extract unique application numbers and addresses from the CSV in one pass."""
+
+    seen: dict[str, dict[str, str]] = {}
+    with csv_path.open(newline="", encoding="utf-8-sig") as fh:
+        reader = csv.DictReader(fh)
+        addr_columns = [c for c in reader.fieldnames or [] if "address" in c.lower()]
+        for row in reader:
+            # Overlong rows park their extra cells in a list under the None key.
+            match = APP_RE.search(" ".join(v for v in row.values() if isinstance(v, str) and v))
+            if not match:
+                continue
+            address = " ".join(row[c] for c in addr_columns if row.get(c))
+            seen[match.group(1)] = {"app_no": match.group(1), "address": address.strip()}
+    print(f"[INFO] Found {len(seen)} unique applications in {csv_path.name}.")
+    return list(seen.values())
 
 
 # ---------------------------------------------------------------------------
@@ -210,25 +320,66 @@ class DownloadResult:
     file_path: Path
 
 
-def open_document_library(page: Page, app_no: str) -> None:
+DOC_ROWS_JS = """
+() => Array.from(document.querySelectorAll("table tr")).map((tr) => {
+    const link = tr.querySelector("a[onclick*='fileDownload']");
+    return { text: tr.innerText, onclick: link ? link.getAttribute("onclick") : null };
+})
+"""
+
+
+# Pager summary and row count, snapshotted before changing the page size.
+DOC_TABLE_STATE_JS = """
+() => ({
+    info: (document.querySelector(".dataTables_info") || {}).textContent || "",
+    rows: document.querySelectorAll("table tbody tr").length,
+})
+"""
+
+
+# The DataTable has redrawn since ``before``: the pager summary changed (or, without
+# one, the row count did), or it already covers every entry. The processing overlay
+# only exists when the table enables it, so it is not relied on alone.
+DOC_TABLE_READY_JS = """
+(before) => {
+    const busy = document.querySelector(".dataTables_processing");
+    if (busy && getComputedStyle(busy).display !== "none") return false;
+    const info = (document.querySelector(".dataTables_info") || {}).textContent || "";
+    const m = info.replace(/,/g, "").match(/(\\d+)\\s+to\\s+(\\d+)\\s+of\\s+(\\d+)/);
+    if (m && m[2] === m[3]) return true;
+    if (info) return info !== before.info;
+    return document.querySelectorAll("table tbody tr").length !== before.rows;
+}
+"""
+
+
+def open_document_library(page: Page, app_no: str) -> bool:
+    """Open the library for ``app_no``; returns whether every row is now on the page."""
+
     url = DOC_URL_TEMPLATE.format(app_no)
     print(f"[INFO] Opening documents for {app_no}…")
     page.goto(url, wait_until="domcontentloaded", timeout=60000)
     try:
-        page.wait_for_selector("body", timeout=30000)
+        page.wait_for_selector("table tr, .dataTables_empty", timeout=30000)
     except PWTimeout:
         raise RuntimeError(f"Document library did not load for {app_no}.")
-    page.wait_for_timeout(3000)
     try:
+        before = page.evaluate(DOC_TABLE_STATE_JS)
         page.select_option("select[name='logisticList_length']", value="100")
-        page.wait_for_timeout(3000)
+        page.wait_for_function(DOC_TABLE_READY_JS, arg=before, timeout=30000)
         print("[INFO] Page size set to 100 entries.")
     except Exception:
         print("[WARN] Could not adjust page size; continuing with defaults.")
+        return False
+    info = DT_INFO_RE.search(page.evaluate(DOC_TABLE_STATE_JS)["info"].replace(",", ""))
+    if info and info.group(2) != info.group(3):
+        print(f"[WARN] {app_no}: only {info.group(2)} of {info.group(3)} documents fit on one page.")
+        return False
+    return True
 
 
 def parse_onclick_arguments(onclick: str) -> Optional[tuple[str, str, str]]:
-    match = re.search(r"fileDownload\('([^']+)',\s*'([^']+)',\s*'([^']+)'\)", onclick)
+    match = ONCLICK_RE.search(onclick)
     if not match:
         return None
     return match.group(1), match.group(2), match.group(3)
@@ -242,26 +393,25 @@ def download_da_forms(
 ) -> list[DownloadResult]:
     """Download DA Form documents for a single application."""
 
-    open_document_library(page, app_no)
-    rows = page.locator("table tr")
+    if recently_scanned(app_no):
+        print(f"[INFO] {app_no}: scanned within the last {SCAN_TTL_HOURS} h; skipping.")
+        return []
+
+    full_page = open_document_library(page, app_no)
+    failures = 0
     results: list[DownloadResult] = []
-    total_rows = rows.count()
+    # One round-trip for the whole table instead of several per row.
+    rows = page.evaluate(DOC_ROWS_JS)
     dest = build_da_folder(app_no, address)
-    print(f"[INFO] {app_no}: scanning {total_rows} document rows…")
+    print(f"[INFO] {app_no}: scanning {len(rows)} document rows…")
 
-    for idx in range(total_rows):
-        row = rows.nth(idx)
-        try:
-            text = row.inner_text(timeout=2000)
-        except Exception:
-            continue
-        if not re.search(r"\bDA\s*Form\b", text, re.IGNORECASE):
-            continue
-        link = row.locator("a[onclick*='fileDownload']").first
-        if link.count() == 0:
+    # Pick the rows to fetch in plain Python; the browser is only called again
+    # to trigger each download.
+    pending: list[tuple[str, str, str, str, Path]] = []
+    for row in rows:
+        if not row["onclick"] or not DA_FORM_RE.search(row["text"] or ""):
             continue
-        onclick = link.get_attribute("onclick") or ""
-        parsed = parse_onclick_arguments(onclick)
+        parsed = parse_onclick_arguments(row["onclick"])
         if not parsed:
             continue
         file_id, file_name, file_type = parsed
@@ -269,7 +419,12 @@ def download_da_forms(
         final_path = dest / f"{app_no}_{safe_name}.{file_type.lower()}"
         if final_path.exists() or in_log(app_no, safe_name):
             continue
+        pending.append((file_id, file_name, file_type, safe_name, final_path))
 
+    if pending:
+        ensure_dir(dest)
+
+    for file_id, file_name, file_type, safe_name, final_path in pending:
         for attempt in range(1, retry_limit + 1):
             try:
                 with page.expect_download(timeout=90000) as download_info:
@@ -279,7 +434,7 @@ def download_da_forms(
                     )
                 download = download_info.value
                 tmp_path = final_path.with_suffix(".partial")
-                download.save_as(str(tmp_path))
+                save_download(download, tmp_path)
                 tmp_path.rename(final_path)
                 append_log(app_no, safe_name, final_path)
                 results.append(
@@ -296,9 +451,61 @@ def download_da_forms(
                 )
                 page.wait_for_timeout(2000)
         else:
+            failures += 1
             print(f"[ERROR] Unable to download DA Form '{file_name}' for {app_no}.")
 
     print(f"[INFO] {app_no}: downloaded {len(results)} DA Form document(s).")
+    # A partial table (page size not applied, or more rows than fit) is not cached.
+    if not failures and full_page:
+        mark_scanned(app_no, len(results))
+    return results
+
+
+def _drain_apps(page: Page, apps: Queue[dict[str, str]], retry_limit: int) -> list[DownloadResult]:
+    results: list[DownloadResult] = []
+    while True:
+        try:
+            app = apps.get_nowait()
+        except Empty:
+            return results
+        results.extend(
+            download_da_forms(
+                page=page,
+                app_no=app["app_no"],
+                address=app.get("address", ""),
+                retry_limit=retry_limit,
+            )
+        )
+
+
+def _forms_worker(headless: bool, apps: Queue[dict[str, str]], retry_limit: int) -> list[DownloadResult]:
+    # Playwright's sync API is bound to the thread that started it, so every
+    # worker runs its own session.
+    with browser_session(headless, viewport=VIEWPORT) as page:
+        return _drain_apps(page, apps, retry_limit)
+
+
+def download_all_forms(
+    page: Page,
+    apps: list[dict[str, str]],
+    headless: bool,
+    retry_limit: int,
+    workers: int,
+) -> list[DownloadResult]:
+    """Download DA Forms for ``apps`` using ``page`` plus ``workers - 1`` extra browsers."""
+
+    queue: Queue[dict[str, str]] = Queue()
+    for app in apps:
+        queue.put(app)
+    extra = min(workers, len(apps)) - 1
+    if extra <= 0:
+        return _drain_apps(page, queue, retry_limit)
+
+    with ThreadPoolExecutor(max_workers=extra) as pool:
+        futures = [pool.submit(_forms_worker, headless, queue, retry_limit) for _ in range(extra)]
+        results = _drain_apps(page, queue, retry_limit)
+        for future in futures:
+            results.extend(future.result())
     return results
 
 
@@ -307,56 +514,65 @@ def download_da_forms(
 # ---------------------------------------------------------------------------
 
 
+RAW_TEXT_LIMIT = 3000
+
+
 def extract_form_data(pdf_path: Path) -> dict[str, str]:
-    text = ""
+    # Plain text extraction, stopping once enough text is collected; no layout analysis.
+    parts: list[str] = []
+    total = 0
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                content = page.extract_text() or ""
-                if content:
-                    text += content + "\n"
+        for page in PdfReader(str(pdf_path)).pages:
+            content = page.extract_text() or ""
+            if content:
+                parts.append(content + "\n")
+                total += len(content) + 1
+            if total >= RAW_TEXT_LIMIT:
+                break
     except Exception:
         return {}
-    return {"RawText": text[:3000]}
+    return {"RawText": "".join(parts)[:RAW_TEXT_LIMIT]}
 
 
-def enrich_and_merge(csv_path: Path) -> Optional[Path]:
+def enrich_and_merge(csv_path: Path, pdf_paths: list[Path]) -> Optional[Path]:
     print("[INFO] Enriching CSV using local DA Form PDFs…")
-    df = pd.read_csv(csv_path, dtype=str, low_memory=False)
-    forms = list(OUT_DIR.rglob("*.pdf"))
+    df = pd.read_csv(csv_path, dtype="string[pyarrow]", engine="pyarrow")
+    if df.columns.duplicated().any():
+        # Only the C engine de-duplicates repeated headers (Address, Address.1).
+        df = pd.read_csv(csv_path, dtype="string[pyarrow]")
+    forms = [path for path in pdf_paths if path.suffix.lower() == ".pdf"]
     if not forms:
         print("[WARN] No DA Forms found for enrichment.")
         return None
 
+    matched = [(pdf_path, m.group(1)) for pdf_path in forms if (m := APP_RE.search(str(pdf_path)))]
     enriched: list[dict[str, str]] = []
-    for pdf_path in tqdm(forms, desc="Processing DA Forms", unit="pdf"):
-        match = re.search(r"(A00\d{6,})", str(pdf_path))
-        if not match:
-            continue
-        data = extract_form_data(pdf_path)
-        if not data:
-            continue
-        data["Application_No"] = match.group(1)
-        data["Source_File"] = str(pdf_path)
-        enriched.append(data)
+    # PDF parsing is CPU-bound, so fan it out across processes.
+    with ProcessPoolExecutor() as pool:
+        extracted = pool.map(extract_form_data, [path for path, _ in matched], chunksize=4)
+        for (pdf_path, app_no), data in tqdm(
+            zip(matched, extracted), total=len(matched), desc="Processing DA Forms", unit="pdf"
+        ):
+            if not data:
+                continue
+            data["Application_No"] = app_no
+            data["Source_File"] = str(pdf_path)
+            enriched.append(data)
 
     if not enriched:
         print("[WARN] DA Forms were downloaded but no text could be extracted.")
         return None
 
     forms_df = pd.DataFrame(enriched)
-    merged = df.copy()
-
-    def _extract_app_no(row: pd.Series) -> str:
-        joined = " ".join(str(value) for value in row.values if pd.notna(value))
-        match = re.search(r"(A00\d{6,})", joined)
-        return match.group(1) if match else ""
-
-    merged["Application_No"] = merged.apply(_extract_app_no, axis=1)
-    merged = pd.merge(merged, forms_df, on="Application_No", how="left")
+    # pd.merge returns a new frame, so the key column can be added to df in place.
+    df["Application_No"] = (
+        join_columns(df, list(df.columns)).str.extract(APP_RE, expand=False).fillna("")
+    )
+    merged = pd.merge(df, forms_df, on="Application_No", how="left")
 
     output_path = OUT_DIR / f"{csv_path.stem}_enriched_{datetime.now():%Y%m%d_%H%M%S}.csv"
-    merged.to_csv(output_path, index=False)
+    # pyarrow's writer is much faster than DataFrame.to_csv on wide RawText columns.
+    pacsv.write_csv(pa.Table.from_pandas(merged, preserve_index=False), str(output_path))
     print(f"[OK] Enriched CSV saved -> {output_path}")
     return output_path
 
@@ -391,6 +607,11 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Skip the enrichment stage and keep the raw CSV only.",
     )
+    parser.add_argument(
+        "--direct-http",
+        action="store_true",
+        help="Try the (unverified) direct HTTP CSV export before the browser flow.",
+    )
     parser.add_argument(
         "--csv-path",
         type=Path,
@@ -402,6 +623,22 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
         default=None,
         help="Limit the number of applications processed when downloading forms.",
     )
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help=f"Revisit document libraries even if scanned within the last {SCAN_TTL_HOURS} h.",
+    )
+    parser.add_argument(
+        "--debug-screenshots",
+        action="store_true",
+        help="Screenshot every browser step, not just failures (same as DEV_I_DEBUG=1).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Browsers downloading DA Forms in parallel (default: 4).",
+    )
     parser.add_argument(
         "--retry-limit",
         type=int,
@@ -417,6 +654,10 @@ def latest_csv_file() -> Optional[Path]:
 
 
 def run_pipeline(args: argparse.Namespace) -> int:
+    if args.debug_screenshots:
+        set_debug(True)
+    if args.rescan:
+        reset_scan_cache()
     ensure_dir(OUT_DIR)
     ensure_dir(SS_DIR)
     ensure_dir(DBG_DIR)
@@ -429,37 +670,33 @@ def run_pipeline(args: argparse.Namespace) -> int:
             print("[ERROR] --skip-csv was provided but no existing CSV was found in output/.")
             return 2
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=args.headless, args=["--no-sandbox", "--disable-gpu"])
-        context = browser.new_context(
-            accept_downloads=True,
-            viewport={"width": 1600, "height": 1000},
-            timezone_id="Australia/Brisbane",
-            locale="en-AU",
-        )
-        page = context.new_page()
-
-        try:
-            if not args.skip_csv:
-                csv_path = download_csv(page, args.days, OUT_DIR)
-            if not args.skip_forms and csv_path:
-                apps = get_applications(csv_path)
-                if args.max_apps is not None:
-                    apps = apps[: args.max_apps]
-                if not apps:
-                    print("[WARN] No applications found in the CSV; skipping DA Form downloads.")
-                for app in apps:
-                    download_da_forms(
-                        page=page,
-                        app_no=app["app_no"],
-                        address=app.get("address", ""),
-                        retry_limit=max(1, args.retry_limit),
-                    )
-        finally:
-            browser.close()
+    all_apps: Optional[list[dict[str, str]]] = None
+    results: list[DownloadResult] = []
+    # One session serves both the CSV download and the DA Form stage.
+    with browser_session(args.headless, viewport=VIEWPORT) as page:
+        if not args.skip_csv:
+            csv_path = download_csv(page, args.days, OUT_DIR, args.direct_http)
+        if not args.skip_forms and csv_path:
+            all_apps = get_applications(csv_path)
+            apps = all_apps if args.max_apps is None else all_apps[: args.max_apps]
+            if not apps:
+                print("[WARN] No applications found in the CSV; skipping DA Form downloads.")
+            results = download_all_forms(
+                page=page,
+                apps=apps,
+                headless=args.headless,
+                retry_limit=max(1, args.retry_limit),
+                workers=max(1, args.workers),
+            )
 
     if not args.skip_enrich and csv_path:
-        enrich_and_merge(csv_path)
+        # This run's downloads plus earlier ones from the log; no walk of output/.
+        if all_apps is None:
+            all_apps = get_applications(csv_path)
+        app_nos = {app["app_no"] for app in all_apps}
+        pdf_paths = [result.file_path for result in results]
+        pdf_paths.extend(logged_form_paths(app_nos))
+        enrich_and_merge(csv_path, list(dict.fromkeys(pdf_paths)))
 
     return 0
 